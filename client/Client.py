@@ -12,20 +12,30 @@ from MCPLite.messages import (
     ListResourceTemplatesRequest,
     ListResourceTemplatesResult,
     JSONRPCResponse,
+    JSONRPCErrorResponse,
     MCPResult,
     minimal_client_initialization,
+    minimal_initialized_notification,
     MCPNotification,
-    Method,
+    CallToolResult,
+    TextContent,
 )
 from MCPLite.logs.logging_config import get_logger
+from MCPLite.messages.Notifications import minimal_initialized_notification_wire
 from MCPLite.primitives.MCPRegistry import ClientRegistry
+from pydantic import ValidationError
 from MCPLite.transport import DirectTransport, Transport, StdioClientTransport
-import json
 from typing import Optional, Callable
 
 # Get logger with this module's name
 logger = get_logger(__name__)
 
+# Handshake singleton and its pre-encoded wire form, bound once through the
+# public accessors so send_notification can identity-check and skip the
+# serialization without reaching into the Notifications module's privates.
+_INITIALIZED_NOTIFICATION = minimal_initialized_notification()
+_INITIALIZED_NOTIFICATION_WIRE = minimal_initialized_notification_wire()
+
 
 class Client:
     def __init__(
@@ -105,7 +115,7 @@ class Client:
             self.registry.prompts += list_prompts_result.prompts
             logger.info("Client updated registry with prompts")
         # Send a notification to the server that the client is initialized.
-        initialized_notification = InitializedNotification()
+        initialized_notification = minimal_initialized_notification()
         logger.info("Client sending InitializedNotification")
         self.send_notification(initialized_notification)
 
@@ -122,38 +132,34 @@ class Client:
         logger.info(
             f"Client received JSON-RPC response from transport: {json_response}"
         )
-        json_obj = json.loads(json_response)
         try:
-            # Check if this is a JSON-RPC error response
-            if "error" in json_obj:
-                error_info = json_obj["error"]
-                error_code = error_info.get("code", -32603)
-                error_message = error_info.get("message", "Unknown error")
-                logger.info(f"Server return JSON-RPC error: {error_info}")
-
-                # Only convert tool call errors to CallToolResult (per MCP spec)
-                if request.method == Method.TOOLS_CALL:
-                    from MCPLite.messages import CallToolResult, TextContent
-
-                    error_content = TextContent(
-                        type="text", text=f"Error {error_code}: {error_message}"
-                    )
+            try:
+                # Validate straight from the JSON string; no json.loads +
+                # model_validate round-trip.
+                jsonrpc_response = JSONRPCResponse.model_validate_json(json_response)
+            except ValidationError:
+                # Not a success frame -- check for a JSON-RPC error response.
+                error_response = JSONRPCErrorResponse.model_validate_json(
+                    json_response
+                )
+                error = error_response.error
+                logger.info(f"Server returned JSON-RPC error: {error}")
 
-                    return CallToolResult(  # type: ignore
-                        content=[error_content], isError=True
-                    )
-            # Handle success response normally
-            jsonrpc_response = JSONRPCResponse(**json_obj)
-            mcp_result = jsonrpc_response.from_json_rpc()
+                # Convert errors to CallToolResult so the agent loop can see them.
+                error_content = TextContent(
+                    type="text", text=f"Error {error.code}: {error.message}"
+                )
+                return CallToolResult(  # type: ignore
+                    content=[error_content], isError=True
+                )
+            mcp_result = jsonrpc_response.from_json_rpc(method=request.method)
             logger.info(
-                f"Client converted JSON-RPC error response to MCPResult object: {mcp_result}"
+                f"Client converted JSON-RPC response to MCPResult object: {mcp_result}"
             )
             return mcp_result
         except Exception as e:
             # If parsing fails completely, create generic error result.
             logger.error(f"Failed to parse server response: {e}")
-            from MCPLite.messages import CallToolResult, TextContent
-
             error_content = TextContent(
                 type="text", text=f"Error parsing response: {str(e)}"
             )
@@ -163,9 +169,12 @@ class Client:
         """
         Send a notification to the server.
         """
-        # Validate pydantic object matches the client/server schema.
-        # Convert to JSON.
-        jsonrpc_notification = notification.to_json_rpc()
-        json_str = jsonrpc_notification.model_dump_json()
+        # The shared handshake notification has a pre-encoded wire form;
+        # anything else is serialized normally.
+        if notification is _INITIALIZED_NOTIFICATION:
+            json_str = _INITIALIZED_NOTIFICATION_WIRE
+        else:
+            jsonrpc_notification = notification.to_json_rpc()
+            json_str = jsonrpc_notification.model_dump_json()
         logger.info("Client sending JSON-RPC notification through transport")
         self.transport.send_json_message(json_str)  # type: ignore
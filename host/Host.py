@@ -30,7 +30,6 @@ from MCPLite.messages import (
     parse_request,
     GetPromptRequest,
     GetPromptResult,
-    Method,
     GetPromptRequestParams,
     PromptMessage,
 )
@@ -601,9 +600,7 @@ class Host:
         for prompt in self.registry.prompts:
             if prompt_name == prompt.name:
                 params = GetPromptRequestParams(name=prompt_name, arguments=kwargs)
-                prompt_request = GetPromptRequest(
-                    method=Method.PROMPTS_GET, params=params
-                )
+                prompt_request = GetPromptRequest(params=params)
 
                 prompt_result: GetPromptResult = self.clients[0].send_request(
                     prompt_request
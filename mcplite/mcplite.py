@@ -87,7 +87,7 @@ class MCPLite:
             return param1 + str(param2)
         ```
         """
-        self.registry.tools.append(MCPTool(function=func))
+        self.registry.add_tool(MCPTool(function=func))
         return func
 
     def resource(
@@ -112,13 +112,13 @@ class MCPLite:
         """
 
         def resource_decorator(func: Callable) -> Callable:
-            self.registry.resources.append(
+            self.registry.add_resource(
                 MCPResource(function=func, uri=uri, mimeType=mime_type, size=size)
             )
             return func
 
         def resource_template_decorator(func: Callable) -> Callable:
-            self.registry.resources.append(
+            self.registry.add_resource(
                 MCPResourceTemplate(function=func, uriTemplate=uri)
             )
             return func
@@ -144,5 +144,5 @@ class MCPLite:
             return f"Prompt with {param1} and {param2}"
         ```
         """
-        self.registry.prompts.append(MCPPrompt(function=func))
+        self.registry.add_prompt(MCPPrompt(function=func))
         return func
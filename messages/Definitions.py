@@ -1,4 +1,5 @@
 from pydantic import BaseModel
+from typing import ClassVar
 
 
 class Definition(BaseModel):
@@ -36,11 +37,15 @@ class ResourceTemplateDefinition(Definition):
     mimeType: str
 
 
-class ToolDefinition(Definition):
-    class InputSchema(BaseModel):
-        type: str
-        properties: dict
+class InputSchema(BaseModel):
+    type: str
+    properties: dict
+
 
+class ToolDefinition(Definition):
     name: str
     description: str
     inputSchema: InputSchema
+
+    # Kept for callers that reference the schema through the class.
+    InputSchema: ClassVar[type[BaseModel]] = InputSchema
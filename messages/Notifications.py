@@ -78,6 +78,27 @@ class InitializedNotification(MCPNotification):
     params: dict[str, Any] = Field(default_factory=dict)
 
 
+# The handshake acknowledgment never varies, so every client can share one
+# instance instead of building a fresh model per initialize.
+_INITIALIZED_NOTIFICATION = InitializedNotification()
+
+
+def minimal_initialized_notification() -> InitializedNotification:
+    """Return the shared initialized notification used for the handshake."""
+    return _INITIALIZED_NOTIFICATION
+
+
+# Its wire form never varies either, so encode it once at import.
+_INITIALIZED_NOTIFICATION_WIRE = (
+    _INITIALIZED_NOTIFICATION.to_json_rpc().model_dump_json()
+)
+
+
+def minimal_initialized_notification_wire() -> str:
+    """Return the pre-encoded JSON-RPC wire form of the shared notification."""
+    return _INITIALIZED_NOTIFICATION_WIRE
+
+
 class RootsListChangedNotification(MCPNotification):
     """Sent when the client's root directories have changed."""
 
@@ -1,39 +1,55 @@
-from pydantic import BaseModel, Field
-from typing import Literal, Optional, Dict, Any
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    PrivateAttr,
+    TypeAdapter,
+    ValidationError,
+)
+from typing import Annotated, Generic, Literal, Optional, Dict, Any, TypeVar, Union
 from MCPLite.messages import MCPMessage
-from uuid import uuid4
-import json
-from enum import Enum
-
-
-class Method(str, Enum):
-    """
-    Request methods are constrained to this list.
-    """
-
-    COMPLETION_COMPLETE = "completion/complete"
-    INITIALIZE = "initialize"
-    LOGGING_SET_LEVEL = "logging/setLevel"
-    PING = "ping"
-    PROMPTS_GET = "prompts/get"
-    PROMPTS_LIST = "prompts/list"
-    RESOURCES_LIST = "resources/list"
-    RESOURCES_READ = "resources/read"
-    RESOURCES_SUBSCRIBE = "resources/subscribe"
-    RESOURCES_TEMPLATES_LIST = "resources/templates/list"
-    RESOURCES_UNSUBSCRIBE = "resources/unsubscribe"
-    ROOTS_LIST = "roots/list"
-    SAMPLING_CREATE_MESSAGE = "sampling/createMessage"
-    TOOLS_CALL = "tools/call"
-    TOOLS_LIST = "tools/list"
-
-    # This ensures the enum serializes to just the string value
-    def __str__(self) -> str:
-        return self.value
-
-    # This helps with JSON serialization
-    def __repr__(self) -> str:
-        return repr(self.value)
+from functools import lru_cache
+from itertools import count
+import sys
+from secrets import token_hex
+
+from MCPLite.logs.logging_config import get_logger
+
+# Get logger with this module's name
+logger = get_logger(__name__)
+
+# JSON-RPC only requires request ids to be unique within a session, so a
+# per-process random prefix plus a monotonic counter is enough -- and far
+# cheaper than a uuid4 syscall + hex formatting per request.
+_id_prefix = token_hex(4)
+_id_counter = count(1)
+
+
+def _next_request_id() -> str:
+    """Generate a session-unique JSON-RPC request id."""
+    return f"{_id_prefix}-{next(_id_counter)}"
+
+
+# Request methods are constrained to this list. A bare Literal validates with
+# a single interned-string comparison, where the old str-Enum added an enum
+# lookup on every request construction.
+Method = Literal[
+    "completion/complete",
+    "initialize",
+    "logging/setLevel",
+    "ping",
+    "prompts/get",
+    "prompts/list",
+    "resources/list",
+    "resources/read",
+    "resources/subscribe",
+    "resources/templates/list",
+    "resources/unsubscribe",
+    "roots/list",
+    "sampling/createMessage",
+    "tools/call",
+    "tools/list",
+]
 
 
 class JSONRPCRequest(BaseModel):
@@ -43,6 +59,8 @@ class JSONRPCRequest(BaseModel):
     We don't worry about the pydantic subclasses (for Params, for example) -- this is just a dict and is created as such from MCPRequest.
     """
 
+    model_config = ConfigDict(frozen=True, defer_build=True)
+
     jsonrpc: Literal["2.0"] = "2.0"
     id: int | str
     method: Method
@@ -57,50 +75,73 @@ class JSONRPCRequest(BaseModel):
         Returns:
             The appropriate Result subclass instance
         """
-        json_rpc_dict = self.model_dump()
-        _ = json_rpc_dict.pop("jsonrpc")
-        _ = json_rpc_dict.pop("id")
-        mcprequest_dict = json_rpc_dict
-        if mcprequest_dict["method"] in method_map:
-            # Find the appropriate class based on the method, and create an instance
-            mcprequest_obj = method_map[mcprequest_dict["method"]](**mcprequest_dict)
-            return mcprequest_obj
-        else:
+        # Interning the incoming method lets the dict probe short-circuit on
+        # pointer equality against the pre-interned method_map keys.
+        method = sys.intern(self.method)
+        mcprequest_class = method_map.get(method)
+        if mcprequest_class is None:
             raise ValueError(
-                f"Method {mcprequest_dict['method']} not found in method_map. Is this in MCP schema?"
+                f"Method {method} not found in method_map. Is this in MCP schema?"
             )
+        # The validating constructor coerces the wire-level params dict into
+        # the typed *RequestParams model; no model_dump round-trip needed.
+        return mcprequest_class(method=method, params=self.params)
 
 
 class MCPRequest(MCPMessage):
+    model_config = ConfigDict(frozen=True, defer_build=True)
+
     method: Method
-    params: BaseModel | dict | None
+    # Params are always a typed model (or absent); subclasses narrow to their
+    # own *RequestParams class. Keeping one representation means no
+    # isinstance branching on the serialization path.
+    params: Optional[BaseModel]
+    # Requests are frozen, so the params dump never changes; cache it after
+    # the first to_jsonrpc so retransmits/logging re-serialize for free.
+    _cached_params_dump: Optional[dict] = PrivateAttr(default=None)
 
     def to_jsonrpc(self) -> JSONRPCRequest:
         """
         Convert this message object to a JSONRPCRequest.
         """
         # Make everything a dict, we shouldn't worry about nested classes here since the ultimate purpose is creating json.
-        if self.params and isinstance(self.params, BaseModel):
-            params_dict = self.params.model_dump() if self.params else None
-        elif self.params:
-            params_dict = self.params
-        else:
+        if self._cached_params_dump is not None:
+            params_dict = self._cached_params_dump
+        elif self.params is None:
             params_dict = None
-        return JSONRPCRequest(
+        elif type(self.params) in _FLAT_PARAM_TYPES:
+            # All-scalar params model: a shallow copy of its field dict is
+            # equivalent to model_dump() without the serializer dispatch.
+            params_dict = self._cached_params_dump = self.params.__dict__.copy()
+        else:
+            params_dict = self._cached_params_dump = self.params.model_dump()
+        # model_construct skips validation; safe because method/params were
+        # validated when this MCPRequest was built.
+        return JSONRPCRequest.model_construct(
             jsonrpc="2.0",
-            id=uuid4().hex,
+            id=_next_request_id(),
             method=self.method,
             params=params_dict,
         )
 
 
-# Some base definitions
-class Role(str, Enum):
-    """Defines the role of a participant in a conversation."""
+P = TypeVar("P", bound=BaseModel)
+
+
+class ParamsRequest(MCPRequest, Generic[P]):
+    """
+    Generic request frame shared by every concrete request class. All requests
+    have the same {method, params} shape and differ only in the params type,
+    so pydantic can reuse the outer schema across parameterizations instead of
+    compiling it once per class.
+    """
 
-    SYSTEM = "system"
-    USER = "user"
-    ASSISTANT = "assistant"
+    params: Optional[P] = None
+
+
+# Some base definitions. The role of a participant in a conversation; a
+# Literal validates as a plain string with no enum-member wrapping.
+Role = Literal["system", "user", "assistant"]
 
 
 # Resources
@@ -116,11 +157,10 @@ class ListResourcesRequestParams(BaseModel):
     cursor: Optional[str] = None
 
 
-class ListResourcesRequest(MCPRequest):
+class ListResourcesRequest(ParamsRequest[ListResourcesRequestParams]):
     """Sent from client to request a list of resources the server has."""
 
-    method: Method = Method("resources/list")
-    params: Optional[ListResourcesRequestParams] = None
+    method: Literal["resources/list"] = "resources/list"
 
 
 class ReadResourceRequestParams(BaseModel):
@@ -129,24 +169,27 @@ class ReadResourceRequestParams(BaseModel):
     uri: str
 
 
-class ReadResourceRequest(MCPRequest):
+class ReadResourceRequest(ParamsRequest[ReadResourceRequestParams]):
     """Sent from client to request the contents of a resource."""
 
-    method: Method = Method("resources/read")
+    method: Literal["resources/read"] = "resources/read"
     params: ReadResourceRequestParams
 
 
 # Resource Templates
 ## Resource Templates have a special list Request and Result, but ReadResource is used for both these and the regular resources.
-class ListResourceTemplatesRequest(MCPRequest):
+class ListResourceTemplatesRequestParams(BaseModel):
+    """Parameters for listing resource templates."""
+
+    cursor: Optional[str] = None
+
+
+class ListResourceTemplatesRequest(ParamsRequest[ListResourceTemplatesRequestParams]):
     """
     Sent from the client to request a list of resource templates the server has.
     """
 
-    method: Method = Method("resources/templates/list")
-    params: Optional[dict[str, Any]] = Field(
-        default_factory=dict, description="Optional parameters for filtering the list"
-    )
+    method: Literal["resources/templates/list"] = "resources/templates/list"
 
 
 # Prompts
@@ -164,11 +207,10 @@ class ListPromptsRequestParams(BaseModel):
     cursor: Optional[str] = None
 
 
-class ListPromptsRequest(MCPRequest):
+class ListPromptsRequest(ParamsRequest[ListPromptsRequestParams]):
     """Sent from client to request a list of prompts and prompt templates."""
 
-    method: Method = Method("prompts/list")
-    params: Optional[ListPromptsRequestParams] = None
+    method: Literal["prompts/list"] = "prompts/list"
 
 
 class GetPromptRequestParams(BaseModel):
@@ -178,10 +220,10 @@ class GetPromptRequestParams(BaseModel):
     arguments: Optional[Dict[str, str]] = None
 
 
-class GetPromptRequest(MCPRequest):
+class GetPromptRequest(ParamsRequest[GetPromptRequestParams]):
     """Used by the client to get a prompt provided by the server."""
 
-    method: Method = Method("prompts/get")
+    method: Literal["prompts/get"] = "prompts/get"
     params: GetPromptRequestParams
 
 
@@ -192,11 +234,10 @@ class ListToolsRequestParams(BaseModel):
     cursor: Optional[str] = None
 
 
-class ListToolsRequest(MCPRequest):
+class ListToolsRequest(ParamsRequest[ListToolsRequestParams]):
     """Sent from client to request a list of tools the server has."""
 
-    method: Method = Method("tools/list")
-    params: Optional[ListToolsRequestParams] = None
+    method: Literal["tools/list"] = "tools/list"
 
 
 class CallToolRequestParams(BaseModel):
@@ -206,10 +247,10 @@ class CallToolRequestParams(BaseModel):
     arguments: Optional[Dict[str, Any]] = None
 
 
-class CallToolRequest(MCPRequest):
+class CallToolRequest(ParamsRequest[CallToolRequestParams]):
     """Used by the client to invoke a tool provided by the server."""
 
-    method: Method = Method("tools/call")
+    method: Literal["tools/call"] = "tools/call"
     params: CallToolRequestParams
 
 
@@ -265,15 +306,26 @@ class InitializeRequestParams(BaseModel):
     )
 
 
-class InitializeRequest(MCPRequest):
+class InitializeRequest(ParamsRequest[InitializeRequestParams]):
     """
     This request is sent from the client to the server when it first connects, asking it to begin initialization.
     """
 
-    method: Method = Method("initialize")
+    method: Literal["initialize"] = "initialize"
     params: InitializeRequestParams
 
 
+# Built (and validated) once at import time; InitializeRequest is frozen, so
+# the shared instance is safe to hand out on every call.
+_MINIMAL_INIT_REQUEST = InitializeRequest(
+    params=InitializeRequestParams(
+        capabilities=ClientCapabilities(),
+        clientInfo=Implementation(name="MyMinimalClient", version="0.1.0"),
+        protocolVersion="1.0.0",
+    )
+)
+
+
 def minimal_client_initialization() -> InitializeRequest:
     """
     Return pydantic object that meets the underlying schema:
@@ -289,24 +341,10 @@ def minimal_client_initialization() -> InitializeRequest:
       }
     }
     """
-    client_info = Implementation(name="MyMinimalClient", version="0.1.0")
-
-    # Create minimal capabilities (empty object)
-    capabilities = ClientCapabilities()
-
-    # Create the request parameters
-    params = InitializeRequestParams(
-        capabilities=capabilities, clientInfo=client_info, protocolVersion="1.0.0"
-    )
+    return _MINIMAL_INIT_REQUEST
 
-    # Create the full request
-    request = InitializeRequest(method="initialize", params=params)
 
-    # Return the request as a JSON string
-    return request
-
-
-MCPRequests = [
+MCPRequests = (
     CallToolRequest,
     GetPromptRequest,
     ReadResourceRequest,
@@ -315,21 +353,68 @@ MCPRequests = [
     ListPromptsRequest,
     ListToolsRequest,
     InitializeRequest,
+)
+
+# A single discriminated union dispatched on the method literal. Pydantic-core
+# resolves the tag in Rust, so parsing is one probe + one validation instead
+# of a Python-level try/except chain over every request class.
+AnyRequest = Annotated[
+    Union[
+        CallToolRequest,
+        GetPromptRequest,
+        ReadResourceRequest,
+        ListResourcesRequest,
+        ListResourceTemplatesRequest,
+        ListPromptsRequest,
+        ListToolsRequest,
+        InitializeRequest,
+    ],
+    Field(discriminator="method"),
 ]
 
+@lru_cache(maxsize=1)
+def _request_adapter() -> TypeAdapter:
+    """Compile the union validator on first use rather than at import."""
+    return TypeAdapter(AnyRequest)
+
 
 def parse_request(json_dict: dict) -> Optional[MCPRequest]:
     """
-    Takes an arbitary JSON string; if it matches the schema of the MCPMessage classes, return the object.
+    Takes an arbitrary dict; if it matches the schema of the MCPMessage classes, return the object.
     """
-    # Add jsonrpc and a uuid to the json_dict if they are not present
-    json_str = json.dumps(json_dict)
-    for message in MCPRequests:
-        try:
-            return message.model_validate_json(json_str)
-        except Exception:
-            continue
-    return None
+    # Only ValidationError is treated as "not an MCP request" -- and it is
+    # logged rather than silently swallowed. Anything else is a real bug and
+    # propagates.
+    try:
+        return _request_adapter().validate_python(json_dict)
+    except ValidationError as e:
+        logger.debug(f"Not a valid MCPRequest: {e}")
+        return None
+
+
+def parse_request_bytes(raw: bytes | str) -> Optional[MCPRequest]:
+    """
+    Parse raw JSON bytes (or str) straight off the transport into an MCPRequest.
+    Feeds the payload directly to the union validator, skipping the intermediate dict.
+    """
+    try:
+        return _request_adapter().validate_json(raw)
+    except ValidationError as e:
+        logger.debug(f"Not a valid MCPRequest: {e}")
+        return None
+
+
+# Params models whose fields are all scalars; to_jsonrpc can serialize these
+# with a plain dict copy instead of a full recursive model_dump().
+_FLAT_PARAM_TYPES = {
+    CallToolRequestParams,
+    ReadResourceRequestParams,
+    GetPromptRequestParams,
+    ListResourcesRequestParams,
+    ListResourceTemplatesRequestParams,
+    ListPromptsRequestParams,
+    ListToolsRequestParams,
+}
 
 
 method_map = {
@@ -349,3 +434,7 @@ method_map = {
     "tools/call": CallToolRequest,
     "tools/list": ListToolsRequest,
 }
+
+# Pre-intern the dispatch keys so lookups against interned method strings can
+# short-circuit on identity.
+method_map = {sys.intern(key): value for key, value in method_map.items()}
@@ -11,10 +11,9 @@ from MCPLite.messages.Definitions import (
     PromptDefinition,
     ToolDefinition,
 )
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Literal, Any, Optional, Union
-from pydantic import BaseModel, Field
-from enum import Enum
+from typing import Annotated as TypeAnnotated  # the Annotated model shadows typing's
 
 
 class MCPResult(BaseModel):
@@ -22,6 +21,9 @@ class MCPResult(BaseModel):
     Base result for all MCP responses.
     """
 
+    # Results are immutable once built, so instances can be shared safely.
+    model_config = ConfigDict(frozen=True, defer_build=True)
+
     meta: Optional[dict[str, Any]] = Field(
         None,
         description="This field is reserved by the protocol to allow clients and servers to attach additional metadata",
@@ -35,68 +37,57 @@ class JSONRPCResponse(MCPMessage):
     A successful (non-error) response to a request.
     """
 
+    model_config = ConfigDict(frozen=True, defer_build=True)
+
     id: Union[str, int]
     jsonrpc: Literal["2.0"] = "2.0"
     result: dict
 
     def from_json_rpc(
         self,
+        method: Optional[str] = None,
     ) -> MCPResult:
         """
         Convert this response's result to the appropriate Result object.
 
+        Args:
+            method: The method of the originating request, if the caller knows
+                it. Dispatching on it is a single dict probe, so prefer
+                passing it over the structural fallback.
+
         Returns:
             The appropriate Result subclass instance
         """
         # Extract the result data
         result_data = self.result
 
-        # Determine the appropriate result type based on method and/or content
-        if isinstance(result_data, dict):
-            # Check for fields specific to different result types
-            if "serverInfo" in result_data and "protocolVersion" in result_data:
-                return InitializeResult(**result_data)
-
-            if "resource" in result_data:
-                return ReadResourceResult(**result_data)
-
-            elif "resources" in result_data:
-                return ListResourcesResult(**result_data)
-
-            elif "resourceTemplates" in result_data:
-                return ListResourceTemplatesResult(**result_data)
-
-            elif "prompts" in result_data:
-                return ListPromptsResult(**result_data)
+        if method is not None:
+            result_class = _METHOD_TO_RESULT.get(method)
+            if result_class is not None:
+                return result_class.model_validate(result_data)
 
-            elif "messages" in result_data:
-                return GetPromptResult(**result_data)
-
-            elif "tools" in result_data:
-                return ListToolsResult(**result_data)
-
-            elif "content" in result_data and any(
-                key in result_data for key in ["isError"]
-            ):
-                return CallToolResult(**result_data)
+        # Fall back to the marker table when the originating method is
+        # unknown, rather than an if/elif chain of membership tests.
+        if isinstance(result_data, dict):
+            for marker, result_class in _RESULT_MARKERS:
+                if marker in result_data:
+                    return result_class.model_validate(result_data)
 
         raise ValueError(
             f"Unknown result type: {result_data}. Please check the MCP protocol for updates."
         )
 
 
-# Content types
-class Role(str, Enum):
-    """Roles in the MCP ecosystem."""
-
-    USER = "user"
-    ASSISTANT = "assistant"
-    SYSTEM = "system"
+# Content types. Roles in the MCP ecosystem; a Literal validates as a plain
+# string with no enum-member wrapping and serializes without .value lookups.
+Role = Literal["user", "assistant", "system"]
 
 
 class Annotations(BaseModel):
     """Annotations provide metadata for protocol objects."""
 
+    model_config = ConfigDict(frozen=True, defer_build=True)
+
     audience: Optional[list[Role]] = None
     priority: Optional[float] = Field(None, ge=0, le=1)
 
@@ -104,6 +95,8 @@ class Annotations(BaseModel):
 class Annotated(BaseModel):
     """Base for objects that include optional annotations."""
 
+    model_config = ConfigDict(frozen=True, defer_build=True)
+
     annotations: Optional[Annotations] = None
 
 
@@ -131,6 +124,8 @@ class BlobResourceContents(BaseModel):
     Binary content of a resource.
     """
 
+    model_config = ConfigDict(frozen=True, defer_build=True)
+
     blob: str = Field(
         ..., description="A base64-encoded string representing binary data"
     )
@@ -145,6 +140,8 @@ class TextResourceContents(BaseModel):
     Text content of a resource.
     """
 
+    model_config = ConfigDict(frozen=True, defer_build=True)
+
     text: str
     uri: str = Field(..., description="The URI of this resource")
     mimeType: Optional[str] = Field(
@@ -161,6 +158,14 @@ class EmbeddedResource(Annotated):
     resource: Union[TextResourceContents, BlobResourceContents]
 
 
+# Discriminated on the "type" literal so pydantic-core picks the right content
+# class with one tag probe instead of trying each union member in turn.
+Content = TypeAnnotated[
+    Union[TextContent, ImageContent, EmbeddedResource],
+    Field(discriminator="type"),
+]
+
+
 # Prompts
 class ListPromptsResult(MCPResult):
     """
@@ -179,6 +184,8 @@ class PromptMessage(BaseModel):
     Base class for all prompt messages.
     """
 
+    model_config = ConfigDict(frozen=True, defer_build=True)
+
     role: Literal["user", "assistant"]
     content: TextContent
 
@@ -217,6 +224,8 @@ class ResourceContents(BaseModel):
     The contents of a resource.
     """
 
+    model_config = ConfigDict(frozen=True, defer_build=True)
+
     uri: str
     contents: Union[TextResourceContents, BlobResourceContents]
 
@@ -247,16 +256,56 @@ class CallToolResult(MCPResult):
     The server's response to a tool call.
     """
 
-    content: list[Union[TextContent, ImageContent, EmbeddedResource]]
+    content: list[Content]
     isError: Optional[bool] = False
 
 
 # Initialization Result
+class PromptsCapability(BaseModel):
+    """The server's prompt-related capabilities."""
+
+    model_config = ConfigDict(frozen=True, defer_build=True)
+
+    listChanged: Optional[bool] = Field(
+        default=None,
+        description="Whether the server supports notifications for changes to the prompt list.",
+    )
+
+
+class ResourcesCapability(BaseModel):
+    """The server's resource-related capabilities."""
+
+    model_config = ConfigDict(frozen=True, defer_build=True)
+
+    subscribe: Optional[bool] = Field(
+        default=None,
+        description="Whether the server supports subscribing to resource updates.",
+    )
+    listChanged: Optional[bool] = Field(
+        default=None,
+        description="Whether the server supports notifications for changes to the resource list.",
+    )
+
+
+class ToolsCapability(BaseModel):
+    """The server's tool-related capabilities."""
+
+    model_config = ConfigDict(frozen=True, defer_build=True)
+
+    listChanged: Optional[bool] = Field(
+        default=None,
+        description="Whether the server supports notifications for changes to the tool list.",
+    )
+
+
 class ServerCapabilities(BaseModel):
     """
     Capabilities that a server may support. Known capabilities are defined here, in this schema, but this is not a closed set: any server can define its own, additional capabilities.
     """
 
+    # Allows additional properties beyond those explicitly defined.
+    model_config = ConfigDict(frozen=True, extra="allow", defer_build=True)
+
     experimental: Optional[dict[str, dict[str, Any]]] = Field(
         default=None,
         description="Experimental, non-standard capabilities that the server supports.",
@@ -265,19 +314,16 @@ class ServerCapabilities(BaseModel):
         default=None,
         description="Present if the server supports sending log messages to the client.",
     )
-    prompts: Optional[dict[str, bool]] = Field(
+    prompts: Optional[PromptsCapability] = Field(
         default=None, description="Present if the server offers any prompt templates."
     )
-    resources: Optional[dict[str, bool]] = Field(
+    resources: Optional[ResourcesCapability] = Field(
         default=None, description="Present if the server offers any resources to read."
     )
-    tools: Optional[dict[str, bool]] = Field(
+    tools: Optional[ToolsCapability] = Field(
         default=None, description="Present if the server offers any tools to call."
     )
 
-    class Config:
-        extra = "allow"  # Allows additional properties beyond those explicitly defined
-
 
 class InitializeResult(MCPResult):
     """
@@ -300,6 +346,34 @@ class InitializeResult(MCPResult):
     )
 
 
+# Built once at import; InitializeResult is frozen, so handing out the same
+# instance on every handshake is safe. Public so callers can identity-check
+# responses against it.
+MINIMAL_INIT_RESULT = InitializeResult(
+    capabilities=ServerCapabilities(
+        # Server supports notifications for prompt list changes
+        prompts=PromptsCapability(listChanged=True),
+        # Server supports subscribing to resource updates and list-change notifications
+        resources=ResourcesCapability(listChanged=True, subscribe=True),
+        # Server doesn't support notifications for tool list changes
+        tools=ToolsCapability(listChanged=False),
+    ),
+    protocolVersion="1.0.0",
+    serverInfo=Implementation(name="MyMinimalServer", version="0.1.0"),
+)
+
+# Pre-computed wire form of the singleton, so the handshake response body
+# never needs another model_dump.
+_MINIMAL_INIT_RESULT_DUMP = MINIMAL_INIT_RESULT.model_dump()
+
+
+def minimal_server_initialization_dump() -> dict:
+    """
+    Return the pre-computed model_dump of the handshake singleton.
+    """
+    return _MINIMAL_INIT_RESULT_DUMP
+
+
 def minimal_server_initialization() -> InitializeResult:
     """
     Return the most minimal pydantic object that satisfies official schema:
@@ -312,31 +386,53 @@ def minimal_server_initialization() -> InitializeResult:
       }
     }
     """
-    server_info = Implementation(name="MyMinimalServer", version="0.1.0")
-
-    # Create minimal capabilities (empty object)
-    capabilities = ServerCapabilities(
-        prompts={
-            "listChanged": True  # Server supports notifications for prompt list changes
-        },
-        resources={
-            "listChanged": True,  # Server supports notifications for resource list changes
-            "subscribe": True,  # Server supports subscribing to resource updates
-        },
-        tools={
-            "listChanged": False  # Server doesn't support notifications for tool list changes
-        },
-    )
-    # Create the full result
-    result = InitializeResult(
-        capabilities=capabilities, protocolVersion="1.0.0", serverInfo=server_info
-    )
+    return MINIMAL_INIT_RESULT
+
+
+# Result type keyed by the request method that produces it.
+_METHOD_TO_RESULT: dict[str, type[MCPResult]] = {
+    "initialize": InitializeResult,
+    "resources/read": ReadResourceResult,
+    "resources/list": ListResourcesResult,
+    "resources/templates/list": ListResourceTemplatesResult,
+    "prompts/list": ListPromptsResult,
+    "prompts/get": GetPromptResult,
+    "tools/list": ListToolsResult,
+    "tools/call": CallToolResult,
+}
+
+
+def _build_result_markers() -> tuple[tuple[str, type[MCPResult]], ...]:
+    """
+    Derive, once at import, the field that uniquely identifies each result
+    type, by introspecting model_fields instead of maintaining a hand-written
+    marker table that can drift as result classes are added.
+    """
+    classes = tuple(dict.fromkeys(_METHOD_TO_RESULT.values()))
+    base_fields = set(MCPResult.model_fields)
+    counts: dict[str, int] = {}
+    for cls in classes:
+        for field in cls.model_fields:
+            if field not in base_fields:
+                counts[field] = counts.get(field, 0) + 1
+    markers = []
+    for cls in classes:
+        unique = [field for field in cls.model_fields if counts.get(field) == 1]
+        # Prefer a required field, which is guaranteed to be on the wire.
+        marker = next(
+            (f for f in unique if cls.model_fields[f].is_required()),
+            unique[0] if unique else None,
+        )
+        if marker is not None:
+            markers.append((marker, cls))
+    return tuple(markers)
 
-    # Return the result as a JSON string
-    return result
 
+# Each result type is recognized by the field that only it carries.
+_RESULT_MARKERS = _build_result_markers()
 
-MCPResults = [
+
+MCPResults = (
     CallToolResult,
     GetPromptResult,
     ReadResourceResult,
@@ -344,4 +440,4 @@ MCPResults = [
     ListResourcesResult,
     ListResourceTemplatesResult,
     ListToolsResult,
-]
+)
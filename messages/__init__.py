@@ -1,128 +1,179 @@
-from MCPLite.messages.MCPMessage import MCPMessage
-from MCPLite.messages.Requests import (
-    Method,
-    MCPRequest,
-    JSONRPCRequest,
-    CallToolRequest,
-    GetPromptRequest,
-    GetPromptRequestParams,
-    ReadResourceRequest,
-    ListResourcesRequest,
-    ListResourceTemplatesRequest,
-    ListPromptsRequest,
-    ListToolsRequest,
-    InitializeRequest,
-    minimal_client_initialization,
-    parse_request,
-)
-from MCPLite.messages.Responses import (
-    MCPResult,
-    JSONRPCResponse,
-    ListResourcesResult,
-    ListResourceTemplatesResult,
-    ListPromptsResult,
-    ListToolsResult,
-    CallToolResult,
-    GetPromptResult,
-    PromptMessage,
-    ReadResourceResult,
-    InitializeResult,
-    minimal_server_initialization,
-    TextContent,
-)
-from MCPLite.messages.Definitions import (
-    PromptDefinition,
-    ToolDefinition,
-    ResourceDefinition,
-    ResourceTemplateDefinition,
-    Argument,
-)
-from MCPLite.messages.Notifications import (
-    MCPNotification,
-    JSONRPCNotification,
-    InitializedNotification,
-    RootsListChangedNotification,
-    ProgressNotification,
-    LogMessageNotification,
-)
-from MCPLite.messages.Errors import (
-    JSONRPCError,
-    JSONRPCErrorResponse,
-    MCPError,
-    ParseError,
-    InvalidRequestError,
-    MethodNotFoundError,
-    InvalidParamsError,
-    InternalError,
-    ProtocolError,
-    NotInitializedError,
-    AlreadyInitializedError,
-    UnsupportedProtocolVersionError,
-    ResourceNotFoundError,
-    ResourceTemplateNotFoundError,
-    PromptNotFoundError,
-    ToolNotFoundError,
-    CapabilityNotSupportedError,
-    RequestCancelledError,
-)
+"""
+Lazy-import facade for the messages package (PEP 562). Importing
+MCPLite.messages no longer pulls in every message module eagerly; each
+submodule is loaded the first time one of its names is requested, and the
+resolved attribute is cached in the package namespace so later lookups are
+plain module-dict hits.
+"""
 
-__all__ = [
-    "MCPMessage",
-    "MCPRequest",
-    "JSONRPCRequest",
-    "GetPromptRequest",
-    "ReadResourceRequest",
-    "CallToolRequest",
-    "ListResourcesRequest",
-    "ListResourceTemplatesRequest",
-    "ListPromptsRequest",
-    "ListToolsRequest",
-    "MCPResult",
-    "JSONRPCResponse",
-    "CallToolResult",
-    "GetPromptResult",
-    "GetPromptRequestParams",
-    "PromptMessage",
-    "ReadResourceResult",
-    "ListResourcesResult",
-    "ListResourceTemplatesResult",
-    "ListPromptsResult",
-    "ListToolsResult",
-    "InitializeRequest",
-    "InitializedNotification",
-    "InitializeResult",
-    "parse_request",
-    "minimal_client_initialization",
-    "InitializeResult",
-    "minimal_server_initialization",
-    "PromptDefinition",
-    "ToolDefinition",
-    "ResourceDefinition",
-    "ResourceTemplateDefinition",
-    "Argument",
-    "Method",
-    "RootsListChangedNotification",
-    "ProgressNotification",
-    "LogMessageNotification",
-    "JSONRPCNotification",
-    "MCPNotification",
-    "JSONRPCError",
-    "JSONRPCErrorResponse",
-    "MCPError",
-    "ParseError",
-    "InvalidRequestError",
-    "MethodNotFoundError",
-    "InvalidParamsError",
-    "InternalError",
-    "ProtocolError",
-    "NotInitializedError",
-    "AlreadyInitializedError",
-    "UnsupportedProtocolVersionError",
-    "ResourceNotFoundError",
-    "ResourceTemplateNotFoundError",
-    "PromptNotFoundError",
-    "ToolNotFoundError",
-    "CapabilityNotSupportedError",
-    "RequestCancelledError",
-    "TextContent",
-]
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from MCPLite.messages.MCPMessage import MCPMessage
+    from MCPLite.messages.Requests import (
+        Method,
+        MCPRequest,
+        JSONRPCRequest,
+        CallToolRequest,
+        GetPromptRequest,
+        GetPromptRequestParams,
+        ReadResourceRequest,
+        ListResourcesRequest,
+        ListResourceTemplatesRequest,
+        ListPromptsRequest,
+        ListToolsRequest,
+        InitializeRequest,
+        minimal_client_initialization,
+        parse_request,
+        parse_request_bytes,
+    )
+    from MCPLite.messages.Responses import (
+        MCPResult,
+        JSONRPCResponse,
+        ListResourcesResult,
+        ListResourceTemplatesResult,
+        ListPromptsResult,
+        ListToolsResult,
+        CallToolResult,
+        GetPromptResult,
+        PromptMessage,
+        ReadResourceResult,
+        InitializeResult,
+        MINIMAL_INIT_RESULT,
+        minimal_server_initialization,
+        minimal_server_initialization_dump,
+        TextContent,
+    )
+    from MCPLite.messages.Definitions import (
+        PromptDefinition,
+        ToolDefinition,
+        ResourceDefinition,
+        ResourceTemplateDefinition,
+        Argument,
+    )
+    from MCPLite.messages.Notifications import (
+        MCPNotification,
+        JSONRPCNotification,
+        InitializedNotification,
+        minimal_initialized_notification,
+        minimal_initialized_notification_wire,
+        RootsListChangedNotification,
+        ProgressNotification,
+        LogMessageNotification,
+    )
+    from MCPLite.messages.Errors import (
+        JSONRPCError,
+        JSONRPCErrorResponse,
+        MCPError,
+        ParseError,
+        InvalidRequestError,
+        MethodNotFoundError,
+        InvalidParamsError,
+        InternalError,
+        ProtocolError,
+        NotInitializedError,
+        AlreadyInitializedError,
+        UnsupportedProtocolVersionError,
+        ResourceNotFoundError,
+        ResourceTemplateNotFoundError,
+        PromptNotFoundError,
+        ToolNotFoundError,
+        CapabilityNotSupportedError,
+        RequestCancelledError,
+    )
+
+# Which submodule provides each public name.
+_ATTR_TO_MODULE = {}
+for _module, _names in {
+    "MCPMessage": ("MCPMessage",),
+    "Requests": (
+        "Method",
+        "MCPRequest",
+        "JSONRPCRequest",
+        "CallToolRequest",
+        "GetPromptRequest",
+        "GetPromptRequestParams",
+        "ReadResourceRequest",
+        "ListResourcesRequest",
+        "ListResourceTemplatesRequest",
+        "ListPromptsRequest",
+        "ListToolsRequest",
+        "InitializeRequest",
+        "minimal_client_initialization",
+        "parse_request",
+        "parse_request_bytes",
+    ),
+    "Responses": (
+        "MCPResult",
+        "JSONRPCResponse",
+        "ListResourcesResult",
+        "ListResourceTemplatesResult",
+        "ListPromptsResult",
+        "ListToolsResult",
+        "CallToolResult",
+        "GetPromptResult",
+        "PromptMessage",
+        "ReadResourceResult",
+        "InitializeResult",
+        "MINIMAL_INIT_RESULT",
+        "minimal_server_initialization",
+        "minimal_server_initialization_dump",
+        "TextContent",
+    ),
+    "Definitions": (
+        "PromptDefinition",
+        "ToolDefinition",
+        "ResourceDefinition",
+        "ResourceTemplateDefinition",
+        "Argument",
+    ),
+    "Notifications": (
+        "MCPNotification",
+        "JSONRPCNotification",
+        "InitializedNotification",
+        "minimal_initialized_notification",
+        "minimal_initialized_notification_wire",
+        "RootsListChangedNotification",
+        "ProgressNotification",
+        "LogMessageNotification",
+    ),
+    "Errors": (
+        "JSONRPCError",
+        "JSONRPCErrorResponse",
+        "MCPError",
+        "ParseError",
+        "InvalidRequestError",
+        "MethodNotFoundError",
+        "InvalidParamsError",
+        "InternalError",
+        "ProtocolError",
+        "NotInitializedError",
+        "AlreadyInitializedError",
+        "UnsupportedProtocolVersionError",
+        "ResourceNotFoundError",
+        "ResourceTemplateNotFoundError",
+        "PromptNotFoundError",
+        "ToolNotFoundError",
+        "CapabilityNotSupportedError",
+        "RequestCancelledError",
+    ),
+}.items():
+    for _name in _names:
+        _ATTR_TO_MODULE[_name] = _module
+
+__all__ = list(_ATTR_TO_MODULE)
+
+
+def __getattr__(name: str):
+    module_name = _ATTR_TO_MODULE.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f"{__name__}.{module_name}"), name)
+    # Cache on the package so subsequent lookups bypass this hook.
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(__all__)
@@ -1,29 +1,12 @@
-from typing import Dict, Any, Optional
-from MCPLite.messages.Notifications import MCPNotification
-from pydantic import Field
+"""
+Thin compatibility module: the canonical InitializedNotification lives in
+MCPLite.messages.Notifications. This used to define a duplicate pydantic
+class, which meant a second schema build for the exact same wire message.
+"""
 
-
-class InitializedNotification(MCPNotification):
-    """
-    This notification is sent from the client to the server after initialization has finished.
-    """
-
-    method: str = "notifications/initialized"
-    params: Optional[Dict[str, Any]] = Field(
-        default={}, description="Optional parameters for the notification"
-    )
+from MCPLite.messages.Notifications import InitializedNotification
 
 
 def create_minimal_initialized_notification() -> InitializedNotification:
-    # Create a minimal notification
-    notification = InitializedNotification()
-
-    # Return the notification as a JSON string
-    return notification
-
-
-# Create and print the notification
-if __name__ == "__main__":
-    i = create_minimal_initialized_notification()
-    print(i)
-    print(i.model_dump_json(indent=2))
+    """Create a minimal initialized notification."""
+    return InitializedNotification()
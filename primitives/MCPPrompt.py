@@ -3,11 +3,16 @@ Note: main class needs to be refactored for pydantic
 """
 
 from typing import Callable
-from inspect import signature
 from MCPLite.messages import PromptDefinition, GetPromptResult, Argument, PromptMessage
 from MCPLite.messages.Responses import TextContent
-from MCPLite.primitives.Primitive import Primitive
-from pydantic import BaseModel, Field
+from MCPLite.primitives.Primitive import (
+    Primitive,
+    _function_description,
+    _function_name,
+    _signature,
+)
+from functools import cached_property
+from pydantic import BaseModel, Field, PrivateAttr
 from typing import Literal
 
 from MCPLite.logs.logging_config import get_logger
@@ -32,7 +37,8 @@ class MCPPrompt(Primitive):
     function: Callable
     description: str = Field(default="")
     name: str = Field(default="")
-    arguments: list[Argument] = Field(default=[])
+    arguments: list[Argument] = Field(default_factory=list)
+    _args_repr: str = PrivateAttr(default="")
 
     def model_post_init(self, __context) -> None:
         """
@@ -42,33 +48,32 @@ class MCPPrompt(Primitive):
         self.name = self._get_name()
         self.description = self._get_description()
         self.arguments = self._get_arguments()
+        # Arguments are fixed after init, so render their repr string once
+        # instead of serializing each Argument on every __repr__ call.
+        self._args_repr = " ".join(
+            argument.model_dump_json() for argument in self.arguments
+        )
 
     def _get_name(self) -> str:
-        try:
-            return self.function.__name__
-        except AttributeError:
-            raise ValueError("Function needs a name, did you just slip me a lambdas?")
+        return _function_name(self.function)
 
     def _get_description(self) -> str:
-        try:
-            return self.function.__doc__.strip()  # type: ignore
-        except AttributeError:
-            raise ValueError("Function needs a docstring.")
+        return _function_description(self.function)
 
     def _get_arguments(self):
         """
         Build a list of Argument objects.
         TBD: allow for parameter descriptions.
         """
-        sig = signature(self.function)
+        sig = _signature(self.function)
         params = sig.parameters
         arguments = []
         for name, param in params.items():
             # A parameter is required if it doesn't have a default value
             # PARAMETER_EMPTY is used to indicate no default value
-            required = param.default == param.empty
-            # Create an Argument object
-            arg = Argument(
+            required = param.default is param.empty
+            # Fields come straight from the signature, so skip validation.
+            arg = Argument.model_construct(
                 name=name,
                 description="",  # Empty description as mentioned
                 required=required,
@@ -86,28 +91,24 @@ class MCPPrompt(Primitive):
             messages: list[PromptMessage]  # Changed from Any for type safety
             description: Optional[str] = None  # Changed from PromptMessage
         """
-        # Prompt functions either return a list of Message or a single string
+        # Prompt functions either return a list of Message or a single string;
+        # normalize the string case and build the result once.
         function_output: str | list[PromptMessage] = self.function(**kwargs)
-        # Detect if single string
         if isinstance(function_output, str):
             function_output = [
                 PromptMessage(
                     role="user", content=TextContent(type="text", text=function_output)
                 )
             ]
-            return GetPromptResult(
-                _meta=None, description=self.description, messages=function_output  # type: ignore
-            )
-        elif isinstance(function_output, list):
-            return GetPromptResult(
-                _meta=None, description=self.description, messages=function_output  # type: ignore
-            )
-        else:
+        elif not isinstance(function_output, list):
             raise ValueError(
                 "Prompt function output is neither str nor list[PromptMessage]."
             )
+        return GetPromptResult(
+            _meta=None, description=self.description, messages=function_output  # type: ignore
+        )
 
-    @property
+    @cached_property
     def definition(self) -> PromptDefinition:
         """
         class PromptDefinition(Definition):
@@ -128,10 +129,4 @@ class MCPPrompt(Primitive):
 
     def __repr__(self):
         """Return a string representation of this prompt."""
-        if self.arguments:
-            args_str = " ".join(
-                [argument.model_dump_json() for argument in self.arguments]
-            )
-        else:
-            args_str = ""
-        return f"<Prompt: {self.name}, Description: {self.description}, Parameters: {args_str}>"
+        return f"<Prompt: {self.name}, Description: {self.description}, Parameters: {self._args_repr}>"
@@ -1,4 +1,6 @@
-from pydantic import BaseModel
+from typing import ClassVar
+
+from pydantic import BaseModel, ConfigDict, PrivateAttr
 from MCPLite.messages.MCPMessage import MCPMessage
 
 # ClientRegistry holds Definitions. These map to Resource, Tool, Prompt in the official MCP schema.
@@ -15,6 +17,16 @@ from MCPLite.messages import (
 # ServerRegistry holds MCPResource, MCPTool, and MCPPrompt. These are the actual implementations of the definitions.
 from MCPLite.primitives import MCPTool, MCPResource, MCPPrompt, MCPResourceTemplate
 
+# Shared result for the common empty-registry case (e.g. rendering a system
+# prompt before the handshake has populated anything); callers treat the
+# definitions dict as read-only.
+_EMPTY_DEFS: dict[str, list[dict]] = {
+    "resources": [],
+    "resource_templates": [],
+    "tools": [],
+    "prompts": [],
+}
+
 
 class ClientRegistry(BaseModel):
     """
@@ -22,28 +34,38 @@ class ClientRegistry(BaseModel):
     Client side this means our MCPMessage objects, which map to MCP schema.
     """
 
+    model_config = ConfigDict(defer_build=True)
+
     resources: list[ResourceDefinition | ResourceTemplateDefinition] = []
     tools: list[ToolDefinition] = []
     prompts: list[PromptDefinition] = []
 
-    # We want to be able to add two registries together.
-    def __add__(self, other: "ClientRegistry"):
+    # Rendered-definitions memo. The registry only ever grows (append/extend),
+    # so the three list lengths are a sufficient cache key; rendering is
+    # re-done only after new definitions arrive.
+    _definitions_cache: dict[str, list[dict]] | None = PrivateAttr(default=None)
+    _definitions_cache_key: tuple[int, int, int] = PrivateAttr(default=(-1, -1, -1))
+
+    # We want to be able to add two registries together. `+` builds a new
+    # registry; `+=` extends this one in place.
+    def __add__(self, other: "ClientRegistry") -> "ClientRegistry":
         """
-        Add two registries together.
+        Return a new registry combining the definitions of both operands.
         """
         try:
-            self.resources.extend(other.resources)
-            self.tools.extend(other.tools)
-            self.prompts.extend(other.prompts)
-            return self
+            return ClientRegistry(
+                resources=[*self.resources, *other.resources],
+                tools=[*self.tools, *other.tools],
+                prompts=[*self.prompts, *other.prompts],
+            )
         except AttributeError:
             raise TypeError(
                 f"Cannot add {type(self)} and {type(other)}. Both must be of type ClientRegistry."
             )
 
-    def __radd__(self, other: "ClientRegistry"):
+    def __iadd__(self, other: "ClientRegistry") -> "ClientRegistry":
         """
-        Add two registries together.
+        Extend this registry in place with another registry's definitions.
         """
         try:
             self.resources.extend(other.resources)
@@ -61,34 +83,32 @@ class ClientRegistry(BaseModel):
         All definitions in the registry, as dicts for rendering system prompt.
         Returns a dictionary with keys "resources", "tools", and "prompts", each of these being a list of dicts (i.e. the definitions per MCP schema).
         """
-        resources = (
-            [
-                resource.model_dump()
-                for resource in self.resources
-                if isinstance(resource, ResourceDefinition)
-            ]
-            if self.resources
-            else []
-        )
-        resource_templates = (
-            [
-                resource.model_dump()
-                for resource in self.resources
-                if isinstance(resource, ResourceTemplateDefinition)
-            ]
-            if self.resources
-            else []
-        )
+        if not (self.resources or self.tools or self.prompts):
+            return _EMPTY_DEFS
+        cache_key = (len(self.resources), len(self.tools), len(self.prompts))
+        if self._definitions_cache is not None and cache_key == self._definitions_cache_key:
+            return self._definitions_cache
+        # Partition in one pass with one isinstance per element, rather than
+        # two filtered scans over the same list.
+        resources: list[dict] = []
+        resource_templates: list[dict] = []
+        for resource in self.resources:
+            if isinstance(resource, ResourceDefinition):
+                resources.append(resource.model_dump())
+            else:
+                resource_templates.append(resource.model_dump())
         tools = [tool.model_dump() for tool in self.tools] if self.tools else []
         prompts = (
             [prompt.model_dump() for prompt in self.prompts] if self.prompts else []
         )
-        return {
+        self._definitions_cache = {
             "resources": resources,
             "resource_templates": resource_templates,
             "tools": tools,
             "prompts": prompts,
         }
+        self._definitions_cache_key = cache_key
+        return self._definitions_cache
 
 
 class ServerRegistry(BaseModel):
@@ -96,28 +116,71 @@ class ServerRegistry(BaseModel):
     A registry that holds resources, tools, and prompts. SErver side this means our MCPResource, MCPTool, and MCPPrompt objects, which map to MCP schema but also have python function code attached.
     """
 
+    model_config = ConfigDict(defer_build=True)
+
     resources: list[MCPResource | MCPResourceTemplate] = []
     tools: list[MCPTool] = []
     prompts: list[MCPPrompt] = []
 
-    # We want to be able to add two registries together.
-    def __add__(self, other: "ServerRegistry"):
+    # Name -> primitive indexes so lookups are O(1). The public lists stay the
+    # source of truth; indexes are rebuilt lazily if a list was mutated
+    # directly (length mismatch), so external appends keep working.
+    _tool_index: dict[str, MCPTool] = PrivateAttr(default_factory=dict)
+    _resource_index: dict[str, MCPResource | MCPResourceTemplate] = PrivateAttr(
+        default_factory=dict
+    )
+    _prompt_index: dict[str, MCPPrompt] = PrivateAttr(default_factory=dict)
+    # Resources get two extra views: a uri -> resource index for resources/read
+    # (templates match by pattern and cannot be probed, so they stay out of
+    # it), and concrete/template sublists so the list endpoints scan only
+    # their own kind. The views track the length of self.resources at build
+    # time because each holds only a subset of that list.
+    _resource_uri_index: dict[str, MCPResource] = PrivateAttr(default_factory=dict)
+    _concrete_resources: list[MCPResource] = PrivateAttr(default_factory=list)
+    _resource_templates: list[MCPResourceTemplate] = PrivateAttr(default_factory=list)
+    _resource_views_len: int = PrivateAttr(default=-1)
+
+    def add_tool(self, tool: MCPTool) -> None:
+        """Register a tool, keeping the name index in sync."""
+        self.tools.append(tool)
+        self._tool_index[tool.name] = tool
+
+    def add_resource(self, resource: MCPResource | MCPResourceTemplate) -> None:
+        """Register a resource or resource template, keeping the name index in sync."""
+        self.resources.append(resource)
+        self._resource_index[resource.name] = resource
+        if isinstance(resource, MCPResourceTemplate):
+            self._resource_templates.append(resource)
+        else:
+            self._concrete_resources.append(resource)
+            self._resource_uri_index[resource.uri] = resource
+        self._resource_views_len = len(self.resources)
+
+    def add_prompt(self, prompt: MCPPrompt) -> None:
+        """Register a prompt, keeping the name index in sync."""
+        self.prompts.append(prompt)
+        self._prompt_index[prompt.name] = prompt
+
+    # We want to be able to add two registries together. `+` builds a new
+    # registry; `+=` extends this one in place.
+    def __add__(self, other: "ServerRegistry") -> "ServerRegistry":
         """
-        Add two registries together.
+        Return a new registry combining the primitives of both operands.
         """
         try:
-            self.resources.extend(other.resources)
-            self.tools.extend(other.tools)
-            self.prompts.extend(other.prompts)
-            return self
+            return ServerRegistry(
+                resources=[*self.resources, *other.resources],
+                tools=[*self.tools, *other.tools],
+                prompts=[*self.prompts, *other.prompts],
+            )
         except AttributeError:
             raise TypeError(
                 f"Cannot add {type(self)} and {type(other)}. Both must be of type ServerRegistry."
             )
 
-    def __radd__(self, other: "ServerRegistry"):
+    def __iadd__(self, other: "ServerRegistry") -> "ServerRegistry":
         """
-        Add two registries together.
+        Extend this registry in place with another registry's primitives.
         """
         try:
             self.resources.extend(other.resources)
@@ -135,42 +198,82 @@ class ServerRegistry(BaseModel):
         """
         Get a tool, resource, or prompt being requested by an MCPMessage request.
         """
-        if isinstance(
-            name, ReadResourceRequest
-        ):  # Need to double check schema if you are getting errors.
-            return self._get_resource(name.params.name)
-        elif isinstance(name, CallToolRequest):
-            return self._get_tool(name.params.name)
-        elif isinstance(name, GetPromptRequest):
-            return self._get_prompt(name.params.name)
-        else:
+        try:
+            getter, params_attr = self._GET_DISPATCH[type(name)]
+        except KeyError:
             raise TypeError(
                 f"Cannot get {type(name)}. Must be of type ResourceRequest, ToolRequest, or PromptRequest."
             )
+        return getter(self, getattr(name.params, params_attr))
 
     def _get_tool(self, name: str) -> MCPTool | None:
         """
         Get a tool by name.
         """
-        for tool in self.tools:
-            if tool.name == name:
-                return tool
-        return None
+        if len(self._tool_index) != len(self.tools):
+            self._tool_index = {tool.name: tool for tool in self.tools}
+        return self._tool_index.get(name)
 
     def _get_resource(self, name: str) -> MCPResource | None:
         """
         Get a resource by name.
         """
+        if len(self._resource_index) != len(self.resources):
+            self._resource_index = {
+                resource.name: resource for resource in self.resources
+            }
+        return self._resource_index.get(name)
+
+    def _rebuild_resource_views(self) -> None:
+        """Re-partition self.resources after direct list mutation."""
+        concrete: list[MCPResource] = []
+        templates: list[MCPResourceTemplate] = []
+        by_uri: dict[str, MCPResource] = {}
         for resource in self.resources:
-            if resource.name == name:
-                return resource
-        return None
+            if isinstance(resource, MCPResourceTemplate):
+                templates.append(resource)
+            else:
+                concrete.append(resource)
+                by_uri[resource.uri] = resource
+        self._concrete_resources = concrete
+        self._resource_templates = templates
+        self._resource_uri_index = by_uri
+        self._resource_views_len = len(self.resources)
+
+    @property
+    def concrete_resources(self) -> list[MCPResource]:
+        """The MCPResource subset of self.resources."""
+        if self._resource_views_len != len(self.resources):
+            self._rebuild_resource_views()
+        return self._concrete_resources
+
+    @property
+    def resource_templates(self) -> list[MCPResourceTemplate]:
+        """The MCPResourceTemplate subset of self.resources."""
+        if self._resource_views_len != len(self.resources):
+            self._rebuild_resource_views()
+        return self._resource_templates
+
+    def _get_resource_by_uri(self, uri: str) -> MCPResource | None:
+        """
+        Get a concrete resource by its exact uri.
+        """
+        if self._resource_views_len != len(self.resources):
+            self._rebuild_resource_views()
+        return self._resource_uri_index.get(uri)
 
     def _get_prompt(self, name: str) -> MCPPrompt | None:
         """
         Get a prompt by name.
         """
-        for prompt in self.prompts:
-            if prompt.name == name:
-                return prompt
-        return None
+        if len(self._prompt_index) != len(self.prompts):
+            self._prompt_index = {prompt.name: prompt for prompt in self.prompts}
+        return self._prompt_index.get(name)
+
+    # Request class -> (lookup method, params attribute carrying the key).
+    # An exact-type dict probe replaces the isinstance chain in get().
+    _GET_DISPATCH: ClassVar[dict] = {
+        ReadResourceRequest: (_get_resource_by_uri, "uri"),
+        CallToolRequest: (_get_tool, "name"),
+        GetPromptRequest: (_get_prompt, "name"),
+    }
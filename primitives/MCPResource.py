@@ -2,7 +2,12 @@ from typing import Callable
 import json
 import re
 from MCPLite.messages.Definitions import ResourceDefinition
-from MCPLite.primitives.Primitive import Primitive
+from MCPLite.primitives.Primitive import (
+    Primitive,
+    _function_description,
+    _function_name,
+)
+from functools import cached_property
 from pydantic import BaseModel, Field
 
 from MCPLite.logs.logging_config import get_logger
@@ -11,7 +16,9 @@ from MCPLite.logs.logging_config import get_logger
 logger = get_logger(__name__)
 
 
-uri_regex = r"^[a-zA-Z][a-zA-Z\d+\-.]*://[^\s/$.?#].[^\s]*"
+# Compiled once at import; re.match with a string pattern re-hits the regex
+# cache's lock on every validation.
+uri_regex = re.compile(r"^[a-zA-Z][a-zA-Z\d+\-.]*://[^\s/$.?#].[^\s]*")
 
 
 def get_string_size_in_bytes(content):
@@ -19,11 +26,10 @@ def get_string_size_in_bytes(content):
     Convert object to bytes using UTF-8 encoding (or another encoding of your choice), return len().
     """
     try:
-        str(content)
+        string_representation = str(content)
     except ValueError:
         raise ValueError("Cannot convert object to string.")
-    byte_representation = str(content).encode("utf-8")
-    return len(byte_representation)
+    return len(string_representation.encode("utf-8"))
 
 
 # Tool class
@@ -68,25 +74,21 @@ class MCPResource(Primitive):
         Validate the URI format.
         Per MCP spec, the URI should be in the format: [protocol]://[host]/[path]
         """
-        if not re.match(uri_regex, uri):
+        # Cheap prefilter: every valid URI contains "://", so skip the regex
+        # for obvious misses.
+        if "://" not in uri or not uri_regex.match(uri):
             raise ValueError(
                 "Invalid URI format. URI should start with a protocol (e.g., http://)"
             )
         return uri
 
     def _get_name(self) -> str:
-        try:
-            return self.function.__name__
-        except AttributeError:
-            raise ValueError("Function needs a name, did you just slip me a lambdas?")
+        return _function_name(self.function)
 
     def _get_description(self) -> str:
-        try:
-            return self.function.__doc__.strip()  # type: ignore
-        except AttributeError:
-            raise ValueError("Function needs a docstring.")
+        return _function_description(self.function)
 
-    @property
+    @cached_property
     def definition(self):
         """Return a dictionary representation of this resource for MCP compatibility."""
         return ResourceDefinition(
@@ -1,10 +1,16 @@
 from typing import Callable, Any
-from inspect import signature, Parameter
+from inspect import Parameter
 import json
 import re
 from MCPLite.messages.Definitions import ResourceTemplateDefinition
 from pydantic import BaseModel, Field
-from MCPLite.primitives.Primitive import Primitive
+from MCPLite.primitives.Primitive import (
+    Primitive,
+    _function_description,
+    _function_name,
+    _signature,
+)
+from functools import cached_property
 
 from MCPLite.logs.logging_config import get_logger
 
@@ -12,7 +18,12 @@ from MCPLite.logs.logging_config import get_logger
 logger = get_logger(__name__)
 
 
-uri_template_regex = r"^[a-zA-Z][a-zA-Z\d+\-.]*://[^\s/$.?#].[^\s]*\{[^}]+\}$"
+# Compiled once at import; re.match with a string pattern re-hits the regex
+# cache's lock on every validation.
+uri_template_regex = re.compile(
+    r"^[a-zA-Z][a-zA-Z\d+\-.]*://[^\s/$.?#].[^\s]*\{[^}]+\}$"
+)
+_uri_param_regex = re.compile(r"{([^}]+)}")
 
 
 def get_string_size_in_bytes(content):
@@ -20,11 +31,10 @@ def get_string_size_in_bytes(content):
     Convert object to bytes using UTF-8 encoding (or another encoding of your choice), return len().
     """
     try:
-        str(content)
+        string_representation = str(content)
     except ValueError:
         raise ValueError("Cannot convert object to string.")
-    byte_representation = str(content).encode("utf-8")
-    return len(byte_representation)
+    return len(string_representation.encode("utf-8"))
 
 
 # Tool class
@@ -91,14 +101,16 @@ class MCPResourceTemplate(Primitive):
         Validate the URI template format.
         Per MCP spec, the URI template should contain parameter placeholders: [protocol]://[host]/[path]/{param}
         """
-        if not re.match(uri_template_regex, uri_pattern):
+        # Cheap prefilter: every valid template contains "://", so skip the
+        # regex for obvious misses.
+        if "://" not in uri_pattern or not uri_template_regex.match(uri_pattern):
             raise ValueError(
                 "Invalid URI template format. URI pattern should start with a protocol (e.g., http://) and contain parameter placeholders in {}"
             )
 
         # Check that all parameters in URI pattern exist in function signature
-        pattern_params = re.findall(r"{([^}]+)}", uri_pattern)
-        sig_params = set(signature(self.function).parameters.keys())
+        pattern_params = _uri_param_regex.findall(uri_pattern)
+        sig_params = set(_signature(self.function).parameters.keys())
 
         for param in pattern_params:
             if param not in sig_params:
@@ -109,16 +121,10 @@ class MCPResourceTemplate(Primitive):
         return uri_pattern
 
     def _get_name(self) -> str:
-        try:
-            return self.function.__name__
-        except AttributeError:
-            raise ValueError("Function needs a name, did you just slip me a lambdas?")
+        return _function_name(self.function)
 
     def _get_description(self) -> str:
-        try:
-            return self.function.__doc__.strip()  # type: ignore
-        except AttributeError:
-            raise ValueError("Function needs a docstring.")
+        return _function_description(self.function)
 
     def _get_parameters(self) -> list[dict[str, Any]]:
         """
@@ -126,15 +132,15 @@ class MCPResourceTemplate(Primitive):
         """
         params = []
 
-        sig = signature(self.function)
+        sig = _signature(self.function)
         for param_name, param in sig.parameters.items():
             param_info = {
                 "name": param_name,
-                "required": param.default == Parameter.empty,
+                "required": param.default is Parameter.empty,
             }
 
             # Try to get type annotation
-            if param.annotation != Parameter.empty:
+            if param.annotation is not Parameter.empty:
                 if hasattr(param.annotation, "__name__"):
                     param_info["type"] = param.annotation.__name__
                 else:
@@ -142,19 +148,21 @@ class MCPResourceTemplate(Primitive):
                     param_info["type"] = str(param.annotation)
 
             # Add default value if available
-            if param.default != Parameter.empty:
+            if param.default is not Parameter.empty:
                 param_info["default"] = param.default
 
             params.append(param_info)
 
-            if not params:
-                raise ValueError(
-                    "Resource template function must have at least one parameter."
-                )
+        # Check once after the loop: the old version returned from inside the
+        # loop body, silently dropping every parameter after the first.
+        if not params:
+            raise ValueError(
+                "Resource template function must have at least one parameter."
+            )
 
-            return params
+        return params
 
-    @property
+    @cached_property
     def definition(self):
         """Return a dictionary representation of this resource template for MCP compatibility."""
         return ResourceTemplateDefinition(
@@ -1,9 +1,15 @@
 from typing import Callable
-from inspect import signature
+from inspect import Parameter
 import json
 from MCPLite.messages.Definitions import ToolDefinition
 from MCPLite.messages.Responses import TextContent
-from MCPLite.primitives.Primitive import Primitive
+from MCPLite.primitives.Primitive import (
+    Primitive,
+    _function_description,
+    _function_name,
+    _signature,
+)
+from functools import cached_property
 from pydantic import BaseModel, Field
 
 from MCPLite.logs.logging_config import get_logger
@@ -48,25 +54,20 @@ class MCPTool(Primitive):
         self.input_schema = self._get_input_schema()
 
     def _get_name(self) -> str:
-        try:
-            return self.function.__name__
-        except AttributeError:
-            raise ValueError("Function needs a name, did you just slip me a lambdas?")
+        return _function_name(self.function)
 
     def _get_description(self) -> str:
-        try:
-            return self.function.__doc__.strip()  # type: ignore
-        except AttributeError:
-            raise ValueError("Function needs a docstring.")
+        return _function_description(self.function)
 
     def _get_input_schema(self) -> dict:
-        sig = signature(self.function)
-        params = sig.parameters
-        input_schema = {
-            name: param.annotation.__name__ for name, param in params.items()
-        }
-        if "_empty" in input_schema.values():
-            raise ValueError("Function parameters must have type annotations.")
+        sig = _signature(self.function)
+        input_schema = {}
+        for name, param in sig.parameters.items():
+            # Catch missing annotations in the single pass, instead of
+            # building the dict and re-scanning its values for "_empty".
+            if param.annotation is Parameter.empty:
+                raise ValueError("Function parameters must have type annotations.")
+            input_schema[name] = param.annotation.__name__
         return input_schema
 
     def __call__(self, **kwargs) -> TextContent:
@@ -84,7 +85,7 @@ class MCPTool(Primitive):
         )
         return content
 
-    @property
+    @cached_property
     def definition(self) -> ToolDefinition:
         """Return a dictionary representation of this tool for MCP compatibility.
         Per MCP spec, the tool should be represented as:
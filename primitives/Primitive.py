@@ -4,7 +4,41 @@ Some higher level classes --
 - Transport: our transport layer, with subclasses for http, sse, stdio
 """
 
-from pydantic import BaseModel
+from functools import lru_cache
+from inspect import Signature, signature
+
+from pydantic import BaseModel, ConfigDict
+
+
+@lru_cache(maxsize=None)
+def _function_name(function) -> str:
+    """
+    Cached function-name extraction shared by every primitive; a function
+    registered as both (say) a tool and a prompt is introspected once.
+    """
+    try:
+        return function.__name__
+    except AttributeError:
+        raise ValueError("Function needs a name, did you just slip me a lambdas?")
+
+
+@lru_cache(maxsize=None)
+def _function_description(function) -> str:
+    """Cached docstring extraction shared by every primitive."""
+    try:
+        return function.__doc__.strip()
+    except AttributeError:
+        raise ValueError("Function needs a docstring.")
+
+
+@lru_cache(maxsize=None)
+def _signature(function) -> Signature:
+    """
+    Cached inspect.signature. Signature construction walks the full function
+    metadata each time, and several primitives inspect the same decorated
+    function more than once during init.
+    """
+    return signature(function)
 
 
 class Primitive(BaseModel):
@@ -13,4 +47,8 @@ class Primitive(BaseModel):
     Handles basic json input and output.
     """
 
-    pass
+    # Primitives carry a Callable and mutate themselves in model_post_init,
+    # so they cannot be frozen; deferring the schema build keeps decorator
+    # imports cheap. Assignments stay unvalidated (pydantic's default), which
+    # is what makes the model_post_init self.foo = ... pattern cheap.
+    model_config = ConfigDict(defer_build=True)
@@ -9,7 +9,27 @@ First of functions to implement:
 - resources/prompts/tools list functions
 """
 
-from MCPLite.messages import *
+from MCPLite.messages import (
+    CallToolRequest,
+    CallToolResult,
+    GetPromptRequest,
+    GetPromptResult,
+    InitializeRequest,
+    InitializeResult,
+    ListPromptsRequest,
+    ListPromptsResult,
+    ListResourcesRequest,
+    ListResourcesResult,
+    ListResourceTemplatesResult,
+    ListToolsRequest,
+    ListToolsResult,
+    MCPNotification,
+    MCPRequest,
+    MCPResult,
+    PromptDefinition,
+    ReadResourceRequest,
+    ResourceTemplateDefinition,
+)
 from MCPLite.messages.Responses import (
     TextContent,
     ReadResourceResult,
@@ -20,21 +40,63 @@ from MCPLite.messages.Responses import (
 )
 from MCPLite.messages.Notifications import InitializedNotification
 from MCPLite.messages.Definitions import ToolDefinition
-from MCPLite.primitives import MCPResource, MCPResourceTemplate
 from pydantic import ValidationError
 from datetime import datetime
+from types import MappingProxyType
+from typing import Mapping
 
 from MCPLite.logs.logging_config import get_logger
 
 # Get logger with this module's name
 logger = get_logger(__name__)
 
+# The handshake response is invariant for the server's lifetime (and the
+# underlying model is frozen), so bind it once instead of calling the
+# factory per initialize request.
+_INIT_RESULT = minimal_server_initialization()
+
+# Method string -> handler attribute name, frozen so nothing can drift from
+# the per-instance dispatch tables built from it. The dispatch table proper
+# is built in __init__ so each entry is an already-bound method.
+_ROUTE_NAMES: Mapping[str, str] = MappingProxyType({
+    "completion/complete": "tools_call",
+    "initialize": "initialize",
+    "notifications/initialized": "initialized",
+    "logging/setLevel": "_noop",
+    "ping": "_noop",
+    "prompts/get": "prompts_get",
+    "prompts/list": "prompts_list",
+    "resources/list": "resources_list",
+    "resources/read": "resources_read",
+    "resources/subscribe": "_noop",
+    "resources/templates/list": "resources_templates_list",
+    "resources/unsubscribe": "_noop",
+    "roots/list": "_noop",
+    "sampling/createMessage": "_noop",
+    "tools/call": "tools_call",
+    "tools/list": "tools_list",
+})
+
 
 class ServerRoute:
 
     def __init__(self, server: "Server"):
         self.server = server
         self.registry = self.server.registry
+        # Bound-method dispatch table: one dict probe per request, no str()
+        # cast and no re-binding of self on every call.
+        self._dispatch = {
+            method: getattr(self, name) for method, name in _ROUTE_NAMES.items()
+        }
+        # List-endpoint memos, keyed by registry list length (the registries
+        # only grow, same convention as ClientRegistry.definitions). Each is
+        # (length, result) and is rebuilt after new primitives register.
+        self._tools_list_cache: tuple[int, ListToolsResult] | None = None
+        self._prompts_list_cache: tuple[int, ListPromptsResult] | None = None
+        self._resources_list_cache: tuple[int, ListResourcesResult] | None = None
+        self._resource_templates_list_cache: (
+            tuple[int, ListResourceTemplatesResult] | None
+        ) = None
 
     def __call__(self, message: MCPRequest | MCPNotification) -> MCPResult:
         """
@@ -44,12 +106,11 @@ class ServerRoute:
         Returns:
             MCPMessage: The response to the request.
         """
-        logger.info(f"Routing request: {message}")
-        # Check if the request is a notification or a request.
-        if str(message.method) in self.routes:
-            return self.routes[str(message.method)](self, message)
-        else:
+        logger.info("Routing request: %s", message)
+        handler = self._dispatch.get(message.method)
+        if handler is None:
             raise ValueError(f"Invalid method: {message.method}")
+        return handler(message)
 
     def initialize(self, request: InitializeRequest) -> InitializeResult:
         """
@@ -57,13 +118,13 @@ class ServerRoute:
         TBD: Eventually we should be interested about Client capabilities; for now it's just a howdy.
         """
         _ = request
-        return minimal_server_initialization()
+        return _INIT_RESULT
 
     def initialized(self, notification: InitializedNotification) -> None:
         """
         Handle the initialized notification from the client.
         """
-        logger.info(f"Received initialized notification - MCP handshake complete")
+        logger.info("Received initialized notification - MCP handshake complete")
         self.server.initialized = True
         self.server.initialization_time = datetime.now()
 
@@ -71,18 +132,19 @@ class ServerRoute:
         # if hasattr(notification, "params") and notification.params:
         #     self.server.client_info = notification.params
 
-        logger.info(f"Server fully initialized at {self.server.initialization_time}")
+        logger.info("Server fully initialized at %s", self.server.initialization_time)
 
     def _check_initialized(self):
         """Helper to check if server is initialized"""
         if not self.server.is_initialized:
             raise RuntimeError("Server not initialized")
 
-    def logging_setLevel(self, request) -> None:
-        pass
-
-    def ping(self, request) -> None:
-        pass
+    def _noop(self, request) -> None:
+        """
+        Shared handler for the not-yet-implemented methods (ping, logging,
+        subscriptions, roots, sampling). One method instead of six empty ones.
+        """
+        return None
 
     def prompts_get(self, request: GetPromptRequest) -> GetPromptResult:
         """
@@ -93,32 +155,26 @@ class ServerRoute:
         Returns:
             GetPromptResult: The result containing the prompt.
         """
-        logger.info(f"Routed to prompts_get route: {request}")
+        logger.info("Routed to prompts_get route: %s", request)
         try:
             prompt_name = request.params.name
         except AttributeError:
             raise ValueError("Prompt name not found in request parameters.")
-        if len(self.registry.prompts) == 0:
-            raise ValueError("No prompts found in registry.")
-        if request.params.name not in [prompt.name for prompt in self.registry.prompts]:
-            raise ValueError(f"Prompt {request.params.name} not found in registry.")
-        for prompt in self.registry.prompts:
-            if prompt_name == request.params.name:
-                request_dict = request.model_dump()
-                # Call the tool with the provided arguments
-                # TBD: we also have ImageContent and EmbeddedResource besides TextContent; implement later.
-                logger.info(
-                    f"Getting prompt: {prompt_name} with arguments: {request_dict['params']['arguments']}"
-                )
-                prompt_response: GetPromptResult = prompt(
-                    **request_dict["params"]["arguments"]
-                )
-                messages = prompt_response
-                logger.info(
-                    f"Returning prompt response: GetPromptResult + messages: {messages}"
-                )
-                return prompt_response
-        raise ValueError(f"Prompt {prompt_name} not found in registry.")
+        # A single index probe replaces the membership check and find-loop;
+        # a miss covers both "empty registry" and "unknown prompt".
+        prompt = self.registry._get_prompt(prompt_name)
+        if prompt is None:
+            raise ValueError(f"Prompt {prompt_name} not found in registry.")
+        # The arguments dict is the only field we need; reading it off the
+        # params model directly skips a recursive model_dump of the request.
+        arguments = request.params.arguments or {}
+        # Call the tool with the provided arguments
+        # TBD: we also have ImageContent and EmbeddedResource besides TextContent; implement later.
+        logger.info("Getting prompt: %s with arguments: %s", prompt_name, arguments)
+        prompt_response: GetPromptResult = prompt(**arguments)
+        messages = prompt_response
+        logger.info("Returning prompt response: GetPromptResult + messages: %s", messages)
+        return prompt_response
 
     def prompts_list(self, request: ListPromptsRequest) -> ListPromptsResult:
         """
@@ -129,12 +185,17 @@ class ServerRoute:
         Returns:
             ListPromptsResult: The result containing the list of prompts.
         """
-        logger.info(f"Routed to prompts_list route: {request}")
+        logger.info("Routed to prompts_list route: %s", request)
+        cached = self._prompts_list_cache
+        if cached is not None and cached[0] == len(self.registry.prompts):
+            return cached[1]
         prompt_list: list[PromptDefinition] = [
             prompt.definition for prompt in self.registry.prompts
         ]
-        logger.info(f"Returning prompt list: {prompt_list}")
-        return ListPromptsResult(_meta=None, prompts=prompt_list, nextCursor=None)
+        logger.info("Returning prompt list: %s", prompt_list)
+        result = ListPromptsResult.model_construct(prompts=prompt_list)
+        self._prompts_list_cache = (len(self.registry.prompts), result)
+        return result
 
     def resources_list(self, request: ListResourcesRequest) -> ListResourcesResult:
         """
@@ -144,29 +205,35 @@ class ServerRoute:
         Returns:
             ListResourcesResult: The result containing the list of resources.
         """
-        logger.info(f"Routed to resources_list route: {request}")
+        logger.info("Routed to resources_list route: %s", request)
+        cached = self._resources_list_cache
+        if cached is not None and cached[0] == len(self.registry.resources):
+            return cached[1]
         resource_list: list[ResourceDefinition] = [
-            resource.definition
-            for resource in self.registry.resources
-            if isinstance(resource, MCPResource)
+            resource.definition for resource in self.registry.concrete_resources
         ]
-        logger.info(f"Returning resource list: {resource_list}")
-        return ListResourcesResult(_meta=None, resources=resource_list)
+        logger.info("Returning resource list: %s", resource_list)
+        result = ListResourcesResult.model_construct(resources=resource_list)
+        self._resources_list_cache = (len(self.registry.resources), result)
+        return result
 
     def resources_templates_list(self, request) -> ListResourceTemplatesResult:
         """
         List all resource templates in the registry.
         """
-        logger.info(f"Routed to resources_templates_list route: {request}")
+        logger.info("Routed to resources_templates_list route: %s", request)
+        cached = self._resource_templates_list_cache
+        if cached is not None and cached[0] == len(self.registry.resources):
+            return cached[1]
         resource_template_list: list[ResourceTemplateDefinition] = [
-            resource.definition
-            for resource in self.registry.resources
-            if isinstance(resource, MCPResourceTemplate)
+            resource.definition for resource in self.registry.resource_templates
         ]
-        logger.info(f"Returning resource template list: {resource_template_list}")
-        return ListResourceTemplatesResult(
-            _meta=None, resourceTemplates=resource_template_list
+        logger.info("Returning resource template list: %s", resource_template_list)
+        result = ListResourceTemplatesResult.model_construct(
+            resourceTemplates=resource_template_list
         )
+        self._resource_templates_list_cache = (len(self.registry.resources), result)
+        return result
 
     def resources_read(self, request: ReadResourceRequest) -> ReadResourceResult | None:
         """
@@ -177,73 +244,51 @@ class ServerRoute:
             Returns:
                 tuple[str, ResourceResponse]: The ID and the resource response.
         """
-        logger.info(f"Routed to resources_read route: {request}")
+        logger.info("Routed to resources_read route: %s", request)
         if len(self.registry.resources) == 0:
             raise ValueError("No resources found in registry.")
-        # Differentiate between resources and resource templates
-        resources = [
-            resource
-            for resource in self.registry.resources
-            if isinstance(resource, MCPResource)
-        ]
-        resource_templates = [
-            resource
-            for resource in self.registry.resources
-            if isinstance(resource, MCPResourceTemplate)
-        ]
-        # Now check if the provided URI matches any existing resource
-        for resource in resources:
-            if resource.uri == request.params.uri:
-                try:
-                    logger.info("Reading resource: {resource.uri}")
-                    resource_data = resource()
-                    contents = TextResourceContents(
-                        uri=resource.uri, text=resource_data, mimeType="text/plain"
-                    )
-                    resource_content = ResourceContents(
-                        uri=resource.uri, contents=contents
-                    )
-                    logger.info(f"Returning resource content: {resource_content}")
-                    return ReadResourceResult(_meta=None, resource=resource_content)
-                except ValidationError as e:
-                    raise ValueError(f"Error reading resource {resource.uri}: {e}")
+        # Exact uris resolve with a single index probe; only templates need a
+        # scan, since they match by pattern.
+        resource = self.registry._get_resource_by_uri(request.params.uri)
+        if resource is not None:
+            try:
+                logger.info("Reading resource: %s", resource.uri)
+                resource_data = resource()
+                contents = TextResourceContents.model_construct(
+                    uri=resource.uri, text=resource_data, mimeType="text/plain"
+                )
+                resource_content = ResourceContents.model_construct(
+                    uri=resource.uri, contents=contents
+                )
+                logger.info("Returning resource content: %s", resource_content)
+                return ReadResourceResult.model_construct(resource=resource_content)
+            except ValidationError as e:
+                raise ValueError(f"Error reading resource {resource.uri}: {e}")
         # If no resource was found, check if the URI matches any resource template
-        for resource_template in resource_templates:
+        for resource_template in self.registry.resource_templates:
             if resource_template.match_uri(request.params.uri):
                 try:
                     logger.info(
-                        "Reading resource template: {resource_template.uriTemplate}"
+                        "Reading resource template: %s", resource_template.uriTemplate
                     )
                     resource_data = resource_template(param=request.params.uri)
-                    contents = TextResourceContents(
+                    contents = TextResourceContents.model_construct(
                         uri=request.params.uri,
                         text=resource_data,
                         mimeType="text/plain",
                     )
-                    resource_content = ResourceContents(
+                    resource_content = ResourceContents.model_construct(
                         uri=request.params.uri, contents=contents
                     )
                     logger.info(
-                        f"Returning resource template content: {resource_content}"
+                        "Returning resource template content: %s", resource_content
                     )
-                    return ReadResourceResult(_meta=None, resource=resource_content)
+                    return ReadResourceResult.model_construct(resource=resource_content)
                 except ValidationError as e:
                     raise ValueError(
                         f"Error reading resource template {resource_template.uriTemplate}: {e}"
                     )
 
-    def resources_subscribe(self, request) -> None:
-        pass
-
-    def resources_unsubscribe(self, request) -> None:
-        pass
-
-    def roots_list(self, request) -> None:
-        pass
-
-    def sampling_createMessage(self, request) -> None:
-        pass
-
     def tools_call(self, request: CallToolRequest) -> CallToolResult:
         """
         Call a tool from the registry.
@@ -252,33 +297,28 @@ class ServerRoute:
         Returns:
             tuple[str, CallToolResult]: The ID and the tool response.
         """
-        logger.info(f"Routed to tools_call route: {request}")
+        logger.info("Routed to tools_call route: %s", request)
         try:
             tool_name = request.params.name
         except AttributeError:
             raise ValueError("Tool name not found in request parameters.")
-        if len(self.registry.tools) == 0:
-            raise ValueError("No tools found in registry.")
-        if request.params.name not in [tool.name for tool in self.registry.tools]:
-            raise ValueError(f"Tool {request.params.name} not found in registry.")
-        for tool in self.registry.tools:
-            if tool.name == request.params.name:
-                request_dict = request.model_dump()
-                # Call the tool with the provided arguments
-                # TBD: we also have ImageContent and EmbeddedResource besides TextContent; implement later.
-                logger.info(
-                    f"Calling tool: {tool_name} with arguments: {request_dict['params']['arguments']}"
-                )
-                tool_response: TextContent = tool(**request_dict["params"]["arguments"])
-                content = [tool_response]
-                logger.info(
-                    f"Returning tool response: CallToolResult + content: {content}"
-                )
-                return CallToolResult(
-                    _meta=None,
-                    content=content,
-                )
-        raise ValueError(f"Tool {tool_name} not found in registry.")
+        # A single index probe replaces the membership check and find-loop;
+        # a miss covers both "empty registry" and "unknown tool".
+        tool = self.registry._get_tool(tool_name)
+        if tool is None:
+            raise ValueError(f"Tool {tool_name} not found in registry.")
+        # The arguments dict is the only field we need; reading it off the
+        # params model directly skips a recursive model_dump of the request.
+        arguments = request.params.arguments or {}
+        # Call the tool with the provided arguments
+        # TBD: we also have ImageContent and EmbeddedResource besides TextContent; implement later.
+        logger.info("Calling tool: %s with arguments: %s", tool_name, arguments)
+        tool_response: TextContent = tool(**arguments)
+        content = [tool_response]
+        logger.info("Returning tool response: CallToolResult + content: %s", content)
+        return CallToolResult.model_construct(
+            content=content,
+        )
 
     def tools_list(self, request: ListToolsRequest) -> ListToolsResult:
         """
@@ -288,31 +328,17 @@ class ServerRoute:
         Returns:
             ListToolsResult: The result containing the list of tools.
         """
-        logger.info(f"Routed to tools_list route: {request}")
+        logger.info("Routed to tools_list route: %s", request)
+        cached = self._tools_list_cache
+        if cached is not None and cached[0] == len(self.registry.tools):
+            return cached[1]
         tool_list: list[ToolDefinition] = [
             tool.definition for tool in self.registry.tools
         ]
-        logger.info(f"Returning tool list: {tool_list}")
-        return ListToolsResult(_meta=None, tools=tool_list)
-
-    routes = {
-        "completion/complete": tools_call,
-        "initialize": initialize,
-        "notifications/initialized": initialized,
-        "logging/setLevel": logging_setLevel,
-        "ping": ping,
-        "prompts/get": prompts_get,
-        "prompts/list": prompts_list,
-        "resources/list": resources_list,
-        "resources/read": resources_read,
-        "resources/subscribe": resources_subscribe,
-        "resources/templates/list": resources_templates_list,
-        "resources/unsubscribe": resources_unsubscribe,
-        "roots/list": roots_list,
-        "sampling/createMessage": sampling_createMessage,
-        "tools/call": tools_call,
-        "tools/list": tools_list,
-    }
+        logger.info("Returning tool list: %s", tool_list)
+        result = ListToolsResult.model_construct(tools=tool_list)
+        self._tools_list_cache = (len(self.registry.tools), result)
+        return result
 
     # def initialized(self, request: MCPRequest) -> MCPMessage:
     #     pass
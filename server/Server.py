@@ -28,17 +28,26 @@ from MCPLite.messages import (
     ToolNotFoundError,
     CapabilityNotSupportedError,
     RequestCancelledError,
+    parse_request_bytes,
+)
+from MCPLite.messages.JsonString import json_loads, json_dumps
+from MCPLite.messages.Responses import (
+    MINIMAL_INIT_RESULT,
+    minimal_server_initialization_dump,
 )
 from MCPLite.primitives import ServerRegistry
 from MCPLite.transport.Transport import Transport
 from MCPLite.routes.ServerRoutes import ServerRoute
-import json
 
 from MCPLite.logs.logging_config import get_logger
 
 # Get logger with this module's name
 logger = get_logger(__name__)
 
+# Wire form of the handshake singleton, fetched once through the public
+# accessor so the per-request identity check below stays a dict reuse.
+_MINIMAL_INIT_RESULT_DUMP = minimal_server_initialization_dump()
+
 
 class Server:
     # Map method names to their corresponding handling functions.
@@ -62,8 +71,8 @@ class Server:
         try:
             # First, parse the JSON
             try:
-                json_obj = json.loads(json_str)
-            except json.JSONDecodeError as e:
+                json_obj = json_loads(json_str)
+            except ValueError as e:
                 # Handle JSON parsing errors
                 logger.error(f"Failed to decode JSON: {e}")
                 raise ParseError(f"Invalid JSON format: {str(e)}")
@@ -75,6 +84,15 @@ class Server:
             if "method" not in json_obj:
                 raise InvalidRequestError("Missing 'method' field in request")
 
+            # Fast path: feed the raw payload straight to the typed-request
+            # union validator, skipping the envelope round-trip through
+            # JSONRPCRequest and from_json_rpc.
+            if request_id is not None:
+                mcp_request = parse_request_bytes(json_str)
+                if mcp_request is not None:
+                    logger.info("Valid JSON-RPC request, processing...")
+                    return self._process_mcp_request(request_id, mcp_request)
+
             # Try to validate as a request first
             try:
                 request = JSONRPCRequest.model_validate(json_obj)
@@ -86,7 +104,7 @@ class Server:
                     notification = JSONRPCNotification.model_validate(json_obj)
                     logger.info("Valid JSON-RPC notification, processing...")
                     self._process_notification(json_obj)
-                    return json.dumps(json_obj)  # Return the original for notifications
+                    return json_dumps(json_obj)  # Return the original for notifications
                 except ValidationError:
                     # Neither a valid request nor notification
                     raise InvalidRequestError(
@@ -107,15 +125,25 @@ class Server:
             return error_response.model_dump_json()
 
     def _process_request(self, json_obj: dict) -> Json:
-        # Process the request.
+        # Fallback path for requests the typed union doesn't recognize.
         json_rpc_request = JSONRPCRequest(**json_obj)
         mcp_request = json_rpc_request.from_json_rpc()
+        return self._process_mcp_request(json_rpc_request.id, mcp_request)
+
+    def _process_mcp_request(self, request_id, mcp_request) -> Json:
+        # Route a parsed MCPRequest and wrap the result in a JSON-RPC response.
         logger.info(f"Routing request: {mcp_request}")
         response: MCPResult = self.route(mcp_request)
-        # Convert the response to JSON-RPC format.
-        # TBD: Implement actual indexing.
+        # The initialize handshake always returns the shared singleton; reuse
+        # its pre-computed dump instead of serializing it again per client.
+        if response is MINIMAL_INIT_RESULT:
+            result = _MINIMAL_INIT_RESULT_DUMP
+        else:
+            result = response.model_dump()
+        # Convert the response to JSON-RPC format, echoing the request id per
+        # the JSON-RPC spec.
         json_rpc_response = JSONRPCResponse(
-            id="blah", jsonrpc="2.0", result=response.model_dump()
+            id=request_id, jsonrpc="2.0", result=result
         )
         logger.info(f"Server sending JSON-RPC response: {json_rpc_response}")
         return json_rpc_response.model_dump_json()